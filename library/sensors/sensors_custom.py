@@ -22,19 +22,27 @@
 # There is no limitation on how much custom data source classes can be added to this file
 # See CustomDataExample theme for the theme implementation part
 
+import atexit
 import math
 import os
 import platform
+import re
 import time
 from abc import ABC, abstractmethod
-from statistics import mean
-from typing import List
+from collections import deque
+from functools import wraps
+from typing import Sequence
 
+import numpy as np
 import psutil
 
 
 # Custom data classes must be implemented in this file, inherit the CustomDataSource and implement its 2 methods
 class CustomDataSource(ABC):
+    # Data sources keep their state in class attributes: an empty __slots__
+    # avoids allocating a per-instance __dict__ for every sensor object
+    __slots__ = ()
+
     @abstractmethod
     def as_numeric(self) -> float:
         # Numeric value will be used for graph and radial progress bars
@@ -50,7 +58,7 @@ class CustomDataSource(ABC):
         pass
 
     @abstractmethod
-    def last_values(self) -> List[float]:
+    def last_values(self) -> Sequence[float]:
         # List of last numeric values will be used for plot graph
         # If you do not want to draw a line graph or if your custom data has no numeric values, keep this function empty
         pass
@@ -58,8 +66,11 @@ class CustomDataSource(ABC):
 
 # Example for a custom data class that has numeric and text values
 class ExampleCustomNumericData(CustomDataSource):
-    # This list is used to store the last 10 values to display a line graph
-    last_val = [math.nan] * 10  # By default, it is filed with math.nan values to indicate there is no data stored
+    __slots__ = ("value",)
+
+    # This ring buffer is used to store the last 10 values to display a line graph
+    # By default, it is filed with math.nan values to indicate there is no data stored
+    last_val = deque([math.nan] * 10, maxlen=10)
 
     def as_numeric(self) -> float:
         # Numeric value will be used for graph and radial progress bars
@@ -67,10 +78,9 @@ class ExampleCustomNumericData(CustomDataSource):
         # Example: self.value = my_module.get_rgb_led_brightness() / audio.system_volume() ...
         self.value = 75.845
 
-        # Store the value to the history list that will be used for line graph
+        # Store the value to the history buffer that will be used for line graph
+        # The deque has a fixed size: appending automatically evicts the oldest value
         self.last_val.append(self.value)
-        # Also remove the oldest value from history list
-        self.last_val.pop(0)
 
         return self.value
 
@@ -86,13 +96,15 @@ class ExampleCustomNumericData(CustomDataSource):
         # --> return f'{self.as_numeric():>4}%'
         # Otherwise, part of the previous value can stay displayed ("ghosting") after a refresh
 
-    def last_values(self) -> List[float]:
+    def last_values(self) -> Sequence[float]:
         # List of last numeric values will be used for plot graph
         return self.last_val
 
 
 # Example for a custom data class that only has text values
 class ExampleCustomTextOnlyData(CustomDataSource):
+    __slots__ = ()
+
     def as_numeric(self) -> float:
         # If there is no numeric value, keep this function empty
         pass
@@ -101,7 +113,7 @@ class ExampleCustomTextOnlyData(CustomDataSource):
         # If a custom data class only has text values, it won't be possible to display graph or radial bars
         return "Python: " + platform.python_version()
 
-    def last_values(self) -> List[float]:
+    def last_values(self) -> Sequence[float]:
         # If a custom data class only has text values, it won't be possible to display line graph
         pass
 
@@ -117,6 +129,7 @@ class ExampleCustomTextOnlyData(CustomDataSource):
 
 import glob
 import subprocess
+import threading
 
 _is_windows = platform.system() == 'Windows'
 _is_linux = platform.system() == 'Linux'
@@ -128,10 +141,19 @@ _lhm_handle = None
 _lhm_Hardware = None
 _lhm_initialized = False
 
+# Sensor/hardware type enums converted to plain ints at init: comparing ints is
+# much cheaper than dispatching pythonnet .NET enum equality in the hot loops
+_LHM_LOAD = None
+_LHM_TEMP = None
+_LHM_CLOCK = None
+_LHM_HW_CPU = None
+_LHM_HW_MEMORY = None
+
 
 def _init_lhm():
     """Lazy-load the LHM handle (Windows only)."""
     global _lhm_handle, _lhm_Hardware, _lhm_initialized
+    global _LHM_LOAD, _LHM_TEMP, _LHM_CLOCK, _LHM_HW_CPU, _LHM_HW_MEMORY
     if _lhm_initialized:
         return
     _lhm_initialized = True
@@ -141,21 +163,71 @@ def _init_lhm():
         from library.sensors.sensors_librehardwaremonitor import handle, Hardware
         _lhm_handle = handle
         _lhm_Hardware = Hardware
+        _LHM_LOAD = int(Hardware.SensorType.Load)
+        _LHM_TEMP = int(Hardware.SensorType.Temperature)
+        _LHM_CLOCK = int(Hardware.SensorType.Clock)
+        _LHM_HW_CPU = int(Hardware.HardwareType.Cpu)
+        _LHM_HW_MEMORY = int(Hardware.HardwareType.Memory)
     except ImportError:
         pass
 
 
+# The hardware inventory is static after LHM Open(): resolve the CPU list once
+# and throttle the expensive .NET Update() calls so that the multiple sensor
+# classes polling the same hardware in one refresh cycle share a single update
+_lhm_cpus_cache = None
+_lhm_last_update = {}
+_LHM_UPDATE_MIN_INTERVAL = 0.9  # seconds between Update() calls per hardware object
+
+
+def _update_hardware_lhm(hw):
+    """Call hw.Update() at most once per _LHM_UPDATE_MIN_INTERVAL."""
+    now = time.monotonic()
+    if now - _lhm_last_update.get(id(hw), 0.0) > _LHM_UPDATE_MIN_INTERVAL:
+        hw.Update()
+        _lhm_last_update[id(hw)] = now
+
+
+def _get_lhm_cpu_list():
+    """Return the cached CPU hardware list, building it on first call."""
+    global _lhm_cpus_cache
+    if _lhm_cpus_cache is None:
+        _lhm_cpus_cache = [hardware for hardware in _lhm_handle.Hardware
+                           if int(hardware.HardwareType) == _LHM_HW_CPU]
+    return _lhm_cpus_cache
+
+
+_lhm_last_tick = 0.0
+_LHM_TICK_INTERVAL = 0.5  # seconds between batch refreshes
+
+
+def tick_lhm():
+    """Batch-refresh all LHM hardware used by the custom sensors.
+
+    A single Update() pass per tick window covers every sensor class read in
+    the same frame, so as_numeric() calls only consume cached .Value
+    properties. The render loop may also call this once before drawing."""
+    global _lhm_last_tick
+    _init_lhm()
+    if _lhm_handle is None:
+        return
+    now = time.monotonic()
+    if now - _lhm_last_tick < _LHM_TICK_INTERVAL:
+        return
+    _lhm_last_tick = now
+    for hardware in _get_lhm_cpu_list():
+        _update_hardware_lhm(hardware)
+    if _lhm_memory_cache is not None:
+        _update_hardware_lhm(_lhm_memory_cache)
+
+
 def _get_cpus_lhm():
-    """Return all CPU hardware objects from LHM, updated."""
+    """Return all CPU hardware objects from LHM, refreshed by the shared tick."""
     _init_lhm()
     if _lhm_handle is None:
         return []
-    cpus = []
-    for hardware in _lhm_handle.Hardware:
-        if hardware.HardwareType == _lhm_Hardware.HardwareType.Cpu:
-            hardware.Update()
-            cpus.append(hardware)
-    return cpus
+    tick_lhm()
+    return _get_lhm_cpu_list()
 
 
 def _get_cpu_by_index_lhm(index):
@@ -163,28 +235,110 @@ def _get_cpu_by_index_lhm(index):
     return cpus[index] if index < len(cpus) else None
 
 
-def _find_sensor_lhm(hw, sensor_type, name_contains=None, name_startswith=None):
-    if hw is None:
-        return None
-    for sensor in hw.Sensors:
-        if sensor.SensorType == sensor_type and sensor.Value is not None:
-            name = str(sensor.Name)
-            if name_contains and name_contains not in name:
-                continue
-            if name_startswith and not name.startswith(name_startswith):
-                continue
-            return sensor
-    return None
+# Sensor topology is also static after Open(): resolve each sensor object once
+# and cache the reference so subsequent polls only read its .Value property.
+# Sensors confirmed absent are cached as _MISSING so polls short-circuit
+# without re-scanning the hardware.
+_lhm_sensor_cache = {}
+_MISSING = object()
+
+_CPU_TEMP_PREFIXES = ("Core Average", "Core Max", "CPU Package", "Core")
+
+# One-pass index of each hardware's sensors keyed by (type, name): every
+# resolve for this hardware (load, temperature, clocks) walks the .NET Sensors
+# collection exactly once and matches against plain Python data afterwards
+_lhm_sensor_index_cache = {}
+
+
+def _get_sensor_index_lhm(hw):
+    """Return {(sensor_type, name): [sensors]} for hw, built in a single pass."""
+    index = _lhm_sensor_index_cache.get(id(hw))
+    if index is None:
+        index = {}
+        for sensor in hw.Sensors:
+            index.setdefault((int(sensor.SensorType), str(sensor.Name)), []).append(sensor)
+        _lhm_sensor_index_cache[id(hw)] = index
+    return index
+
+
+def _resolve_sensor_lhm(hw, sensor_type, prefixes):
+    """Resolve the first sensor of hw matching one of the name prefixes.
+    The resolved sensor reference is cached so the index is only matched once."""
+    key = (id(hw), sensor_type, prefixes)
+    sensor_found = _lhm_sensor_cache.get(key)
+    if sensor_found is None:
+        index = _get_sensor_index_lhm(hw)
+        for prefix in prefixes:
+            for (sensor_type_key, name), sensors in index.items():
+                if sensor_type_key == sensor_type and name.startswith(prefix):
+                    for sensor in sensors:
+                        if sensor.Value is not None:
+                            sensor_found = sensor
+                            break
+                if sensor_found is not None:
+                    break
+            if sensor_found is not None:
+                break
+        # Cache misses too: a sensor that does not exist on this hardware will
+        # not appear later, so there is no point re-matching every poll
+        _lhm_sensor_cache[key] = sensor_found if sensor_found is not None else _MISSING
+    return None if sensor_found is _MISSING else sensor_found
+
+
+def _resolve_core_clocks_lhm(hw):
+    """Resolve the per-core clock sensors of hw as a cached tuple."""
+    key = (id(hw), 'core_clocks')
+    clocks = _lhm_sensor_cache.get(key)
+    if clocks is None:
+        clocks = []
+        for (sensor_type_key, name), sensors in _get_sensor_index_lhm(hw).items():
+            if sensor_type_key == _LHM_CLOCK and "Core #" in name and "Effective" not in name:
+                clocks.extend(sensors)
+        # An empty tuple is cached as well so hardware without matching clock
+        # sensors is only matched once
+        clocks = tuple(clocks)
+        _lhm_sensor_cache[key] = clocks
+    return clocks
 
 
 # ---------------------------------------------------------------------------
 # Linux helpers: per-CPU temperature, frequency, fan via /sys and psutil
 # ---------------------------------------------------------------------------
-def _linux_get_cpu_temperatures():
+# All CPU sources polling in the same refresh tick share one snapshot per
+# getter: the second socket's read is a dict lookup instead of a psutil call
+# plus a sysfs walk
+_SNAPSHOT_TTL = 0.25  # seconds
+
+
+def _snapshot_cached(getter):
+    """Memoize a zero-argument getter with a _SNAPSHOT_TTL monotonic TTL."""
+    cache = {"ts": 0.0, "val": None}
+
+    @wraps(getter)
+    def wrapper():
+        now = time.monotonic()
+        if cache["val"] is None or now - cache["ts"] > _SNAPSHOT_TTL:
+            cache["val"] = getter()
+            cache["ts"] = now
+        return cache["val"]
+
+    return wrapper
+
+
+@_snapshot_cached
+def _get_sensor_temps():
+    """Shared psutil.sensors_temperatures() snapshot for all thermal sensors."""
+    try:
+        return psutil.sensors_temperatures()
+    except Exception:
+        return {}
+
+
+def _read_cpu_temperatures():
     """Return a dict of {physical_package_id: temperature} from coretemp or k10temp."""
     temps = {}
     try:
-        sensor_temps = psutil.sensors_temperatures()
+        sensor_temps = _get_sensor_temps()
         # coretemp (Intel) reports per-package temperatures
         if 'coretemp' in sensor_temps:
             for entry in sensor_temps['coretemp']:
@@ -211,57 +365,94 @@ def _linux_get_cpu_temperatures():
     return temps
 
 
-def _linux_get_per_cpu_frequencies():
+def _read_sysfs_int(path):
+    """Read a single-value sysfs file as an int.
+
+    Uses raw os.open/os.read instead of a buffered file object: sysfs values
+    are tiny and the buffering/encoding setup costs more than the read."""
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        return int(os.read(fd, 16))
+    finally:
+        os.close(fd)
+
+
+# The logical-CPU -> physical-package topology never changes after boot: build
+# the map once at first use and reuse it from every getter
+_pkg_map_cache = None
+
+
+def _get_pkg_map():
+    """Return the cached list mapping logical CPU id -> physical package id."""
+    global _pkg_map_cache
+    if _pkg_map_cache is None:
+        pkg_map = []
+        for i in range(psutil.cpu_count() or 0):
+            try:
+                pkg_map.append(_read_sysfs_int(f'/sys/devices/system/cpu/cpu{i}/topology/physical_package_id'))
+            except (OSError, ValueError):
+                pkg_map.append(0)  # fallback: all on package 0
+        _pkg_map_cache = pkg_map
+    return _pkg_map_cache
+
+
+def _num_packages():
+    pkg_map = _get_pkg_map()
+    return max(pkg_map) + 1 if pkg_map else 0
+
+
+_pkg_ids_cache = None
+
+
+def _get_pkg_ids():
+    """Return the package map as a cached int32 NumPy array for bincount grouping."""
+    global _pkg_ids_cache
+    if _pkg_ids_cache is None:
+        _pkg_ids_cache = np.asarray(_get_pkg_map(), dtype=np.int32)
+    return _pkg_ids_cache
+
+
+def _read_per_cpu_frequencies():
     """Return a dict of {cpu_package_index: avg_frequency_mhz}.
     Groups logical CPUs by physical package ID."""
     pkg_freqs = {}
     try:
-        # Read per-CPU frequencies and group by physical package
         per_cpu = psutil.cpu_freq(percpu=True)
         if per_cpu:
-            # Try to map logical CPU -> physical package via sysfs
-            pkg_map = {}  # logical_cpu_id -> package_id
-            for i in range(len(per_cpu)):
-                try:
-                    pkg_path = f'/sys/devices/system/cpu/cpu{i}/topology/physical_package_id'
-                    with open(pkg_path) as f:
-                        pkg_map[i] = int(f.read().strip())
-                except (FileNotFoundError, ValueError):
-                    pkg_map[i] = 0  # fallback: all on package 0
-
-            # Group frequencies by package
-            from collections import defaultdict
-            grouped = defaultdict(list)
-            for i, freq in enumerate(per_cpu):
-                pkg_id = pkg_map.get(i, 0)
-                grouped[pkg_id].append(freq.current)
-
-            for pkg_id, freqs in grouped.items():
-                pkg_freqs[pkg_id] = mean(freqs)
+            # Per-package averages in one vectorized pass: weighted bincount
+            # sums per package, plain bincount counts members
+            pkg_ids = _get_pkg_ids()
+            n = min(len(per_cpu), len(pkg_ids))
+            vals = np.fromiter((per_cpu[i].current for i in range(n)), dtype=np.float64, count=n)
+            sums = np.bincount(pkg_ids[:n], weights=vals, minlength=_num_packages())
+            counts = np.bincount(pkg_ids[:n], minlength=_num_packages())
+            for pkg_id, count in enumerate(counts):
+                if count:
+                    pkg_freqs[pkg_id] = float(sums[pkg_id] / count)
     except Exception:
         pass
     return pkg_freqs
 
 
+# Max frequency is a hardware constant: the resolved dict is cached for the
+# process lifetime so the second socket's lookup does not redo the sysfs scan
+_max_freq_cache = None
+
+
 def _linux_get_per_cpu_max_frequencies():
     """Return a dict of {cpu_package_index: max_frequency_mhz}.
     Groups logical CPUs by physical package ID and takes the max."""
+    global _max_freq_cache
+    if _max_freq_cache is not None:
+        return _max_freq_cache
     pkg_max_freqs = {}
     try:
         per_cpu = psutil.cpu_freq(percpu=True)
         if per_cpu:
-            pkg_map = {}
-            for i in range(len(per_cpu)):
-                try:
-                    with open(f'/sys/devices/system/cpu/cpu{i}/topology/physical_package_id') as f:
-                        pkg_map[i] = int(f.read().strip())
-                except (FileNotFoundError, ValueError):
-                    pkg_map[i] = 0
-
-            from collections import defaultdict
-            grouped = defaultdict(list)
+            pkg_map = _get_pkg_map()
+            grouped = [[] for _ in range(_num_packages())]
             for i, freq in enumerate(per_cpu):
-                pkg_id = pkg_map.get(i, 0)
+                pkg_id = pkg_map[i] if i < len(pkg_map) else 0
                 max_mhz = freq.max if freq.max else 0
                 if max_mhz <= 0:
                     # Fallback: read from sysfs (value is in KHz)
@@ -270,444 +461,569 @@ def _linux_get_per_cpu_max_frequencies():
                         f'/sys/devices/system/cpu/cpu{i}/cpufreq/scaling_max_freq'
                     ]:
                         try:
-                            with open(path) as f:
-                                max_mhz = int(f.read().strip()) / 1000
-                                break
-                        except Exception:
+                            max_mhz = _read_sysfs_int(path) / 1000
+                            break
+                        except (OSError, ValueError):
                             pass
                 if max_mhz > 0:
                     grouped[pkg_id].append(max_mhz)
 
-            for pkg_id, maxes in grouped.items():
-                pkg_max_freqs[pkg_id] = max(maxes)
+            for pkg_id, maxes in enumerate(grouped):
+                if maxes:
+                    pkg_max_freqs[pkg_id] = max(maxes)
     except Exception:
         pass
+    _max_freq_cache = pkg_max_freqs
     return pkg_max_freqs
 
 
-def _linux_get_per_cpu_usage():
+def _read_per_cpu_usage():
     """Return a dict of {cpu_package_index: usage_percent}.
     Groups logical CPUs by physical package ID. Uses cached interval."""
     pkg_usage = {}
     try:
         per_cpu = psutil.cpu_percent(interval=None, percpu=True)
         if per_cpu:
-            pkg_map = {}
-            for i in range(len(per_cpu)):
-                try:
-                    pkg_path = f'/sys/devices/system/cpu/cpu{i}/topology/physical_package_id'
-                    with open(pkg_path) as f:
-                        pkg_map[i] = int(f.read().strip())
-                except (FileNotFoundError, ValueError):
-                    pkg_map[i] = 0
-
-            from collections import defaultdict
-            grouped = defaultdict(list)
-            for i, pct in enumerate(per_cpu):
-                pkg_id = pkg_map.get(i, 0)
-                grouped[pkg_id].append(pct)
-
-            for pkg_id, pcts in grouped.items():
-                pkg_usage[pkg_id] = mean(pcts)
+            pkg_ids = _get_pkg_ids()
+            n = min(len(per_cpu), len(pkg_ids))
+            vals = np.asarray(per_cpu[:n], dtype=np.float64)
+            sums = np.bincount(pkg_ids[:n], weights=vals, minlength=_num_packages())
+            counts = np.bincount(pkg_ids[:n], minlength=_num_packages())
+            for pkg_id, count in enumerate(counts):
+                if count:
+                    pkg_usage[pkg_id] = float(sums[pkg_id] / count)
     except Exception:
         pass
     return pkg_usage
 
 
-def _linux_get_memory_clock():
-    """Try to read memory clock speed on Linux via dmidecode or /sys."""
-    # Method 1: Try dmidecode directly (works if running as root)
-    try:
-        output = subprocess.check_output(
-            ['dmidecode', '-t', 'memory'], stderr=subprocess.DEVNULL, timeout=2
-        ).decode('utf-8', errors='replace')
-        speeds = []
-        for line in output.splitlines():
-            line = line.strip()
-            if line.startswith('Configured Memory Speed:') or line.startswith('Configured Clock Speed:'):
-                val = line.split(':')[1].strip().split()[0]
-                if val.isdigit() and int(val) > 0:
-                    speeds.append(int(val))
-        if speeds:
-            return max(speeds)
-    except Exception:
-        pass
-    # Method 2: Try sudo -n dmidecode (works if NOPASSWD is configured)
-    try:
-        output = subprocess.check_output(
-            ['sudo', '-n', 'dmidecode', '-t', 'memory'], stderr=subprocess.DEVNULL, timeout=3
-        ).decode('utf-8', errors='replace')
-        speeds = []
-        for line in output.splitlines():
-            line = line.strip()
-            if line.startswith('Configured Memory Speed:') or line.startswith('Configured Clock Speed:'):
-                val = line.split(':')[1].strip().split()[0]
-                if val.isdigit() and int(val) > 0:
-                    speeds.append(int(val))
-        if speeds:
-            return max(speeds)
-    except Exception:
-        pass
-    # Method 3: Try decode-dimms from i2c-tools
-    try:
-        output = subprocess.check_output(
-            ['decode-dimms'], stderr=subprocess.DEVNULL, timeout=5
-        ).decode('utf-8', errors='replace')
-        for line in output.splitlines():
-            if 'Maximum module speed' in line:
-                parts = line.split()
-                for p in parts:
-                    if p.isdigit() and int(p) > 100:
-                        return int(p)
-    except Exception:
-        pass
-    # Method 4: Fallback - return 0 (not available without root)
-    return 0
-
-
-# ---------------------------------------------------------------------------
-# Per-CPU Percentage (Load %)
-# ---------------------------------------------------------------------------
-class Cpu0Percentage(CustomDataSource):
-    last_val = [math.nan] * 10
-    value = 0.0
-
-    def as_numeric(self) -> float:
-        if _is_linux:
-            usage = _linux_get_per_cpu_usage()
-            if 0 in usage:
-                Cpu0Percentage.value = usage[0]
-                Cpu0Percentage.last_val.append(Cpu0Percentage.value)
-                Cpu0Percentage.last_val.pop(0)
-                return Cpu0Percentage.value
-        elif _is_windows:
-            _init_lhm()
-            cpu = _get_cpu_by_index_lhm(0)
-            if cpu:
-                sensor = _find_sensor_lhm(cpu, _lhm_Hardware.SensorType.Load, name_startswith="CPU Total")
-                if sensor:
-                    Cpu0Percentage.value = float(sensor.Value)
-                    Cpu0Percentage.last_val.append(Cpu0Percentage.value)
-                    Cpu0Percentage.last_val.pop(0)
-                    return Cpu0Percentage.value
-        return math.nan
-
-    def as_string(self) -> str:
-        return f'{Cpu0Percentage.value:.0f}%'
+@_snapshot_cached
+def _linux_cpu_snapshot():
+    """Collect per-package usage, frequency and temperature in one fused pass.
 
-    def last_values(self) -> List[float]:
-        return Cpu0Percentage.last_val
+    The CPU data sources for both sockets read from this snapshot, so each
+    refresh walks every psutil per-CPU source exactly once and the three
+    metrics age out together under the shared snapshot TTL."""
+    return {
+        'usage': _read_per_cpu_usage(),
+        'freq': _read_per_cpu_frequencies(),
+        'temp': _read_cpu_temperatures(),
+    }
 
 
-class Cpu1Percentage(CustomDataSource):
-    last_val = [math.nan] * 10
-    value = 0.0
+def _linux_get_per_cpu_usage():
+    return _linux_cpu_snapshot()['usage']
 
-    def as_numeric(self) -> float:
-        if _is_linux:
-            usage = _linux_get_per_cpu_usage()
-            if 1 in usage:
-                Cpu1Percentage.value = usage[1]
-                Cpu1Percentage.last_val.append(Cpu1Percentage.value)
-                Cpu1Percentage.last_val.pop(0)
-                return Cpu1Percentage.value
-        elif _is_windows:
-            _init_lhm()
-            cpu = _get_cpu_by_index_lhm(1)
-            if cpu:
-                sensor = _find_sensor_lhm(cpu, _lhm_Hardware.SensorType.Load, name_startswith="CPU Total")
-                if sensor:
-                    Cpu1Percentage.value = float(sensor.Value)
-                    Cpu1Percentage.last_val.append(Cpu1Percentage.value)
-                    Cpu1Percentage.last_val.pop(0)
-                    return Cpu1Percentage.value
-        return math.nan
 
-    def as_string(self) -> str:
-        return f'{Cpu1Percentage.value:.0f}%'
+def _linux_get_per_cpu_frequencies():
+    return _linux_cpu_snapshot()['freq']
 
-    def last_values(self) -> List[float]:
-        return Cpu1Percentage.last_val
 
+def _linux_get_cpu_temperatures():
+    return _linux_cpu_snapshot()['temp']
 
-# ---------------------------------------------------------------------------
-# Per-CPU Temperature
-# ---------------------------------------------------------------------------
-class Cpu0Temperature(CustomDataSource):
-    last_val = [math.nan] * 10
-    value = 0.0
 
-    def as_numeric(self) -> float:
-        if _is_linux:
-            temps = _linux_get_cpu_temperatures()
-            if 0 in temps:
-                Cpu0Temperature.value = temps[0]
-                Cpu0Temperature.last_val.append(Cpu0Temperature.value)
-                Cpu0Temperature.last_val.pop(0)
-                return Cpu0Temperature.value
-        elif _is_windows:
-            _init_lhm()
-            cpu = _get_cpu_by_index_lhm(0)
-            if cpu:
-                for name_prefix in ["Core Average", "Core Max", "CPU Package", "Core"]:
-                    sensor = _find_sensor_lhm(cpu, _lhm_Hardware.SensorType.Temperature, name_startswith=name_prefix)
-                    if sensor:
-                        Cpu0Temperature.value = float(sensor.Value)
-                        Cpu0Temperature.last_val.append(Cpu0Temperature.value)
-                        Cpu0Temperature.last_val.pop(0)
-                        return Cpu0Temperature.value
-        return math.nan
+# Probe binaries confirmed absent are never forked again
+_dmidecode_unavailable = False
+_decode_dimms_unavailable = False
 
-    def as_string(self) -> str:
-        return f'{Cpu0Temperature.value:.0f}\u00b0C'
 
-    def last_values(self) -> List[float]:
-        return Cpu0Temperature.last_val
+# Matches "Configured Memory Speed: 3200 MT/s" and the older "Configured Clock
+# Speed:" label; applied to the raw bytes so the verbose dmidecode output is
+# scanned in C without allocating per-line strings
+_MEM_SPEED_RE = re.compile(rb'Configured (?:Memory|Clock) Speed:\s*(\d+)\s')
 
 
-class Cpu1Temperature(CustomDataSource):
-    last_val = [math.nan] * 10
-    value = 0.0
+def _parse_dmidecode_speeds(raw):
+    return [speed for speed in map(int, _MEM_SPEED_RE.findall(raw)) if speed > 0]
 
-    def as_numeric(self) -> float:
-        if _is_linux:
-            temps = _linux_get_cpu_temperatures()
-            if 1 in temps:
-                Cpu1Temperature.value = temps[1]
-                Cpu1Temperature.last_val.append(Cpu1Temperature.value)
-                Cpu1Temperature.last_val.pop(0)
-                return Cpu1Temperature.value
-        elif _is_windows:
-            _init_lhm()
-            cpu = _get_cpu_by_index_lhm(1)
-            if cpu:
-                for name_prefix in ["Core Average", "Core Max", "CPU Package", "Core"]:
-                    sensor = _find_sensor_lhm(cpu, _lhm_Hardware.SensorType.Temperature, name_startswith=name_prefix)
-                    if sensor:
-                        Cpu1Temperature.value = float(sensor.Value)
-                        Cpu1Temperature.last_val.append(Cpu1Temperature.value)
-                        Cpu1Temperature.last_val.pop(0)
-                        return Cpu1Temperature.value
-        return math.nan
 
-    def as_string(self) -> str:
-        return f'{Cpu1Temperature.value:.0f}\u00b0C'
-
-    def last_values(self) -> List[float]:
-        return Cpu1Temperature.last_val
+def _linux_get_memory_clock():
+    """Try to read memory clock speed on Linux via dmidecode or /sys."""
+    global _dmidecode_unavailable, _decode_dimms_unavailable
+    if not _dmidecode_unavailable:
+        # Method 1: Try dmidecode directly (works if running as root)
+        try:
+            raw = subprocess.check_output(
+                ['dmidecode', '-t', 'memory'], stderr=subprocess.DEVNULL, timeout=2
+            )
+            speeds = _parse_dmidecode_speeds(raw)
+            if speeds:
+                return max(speeds)
+        except FileNotFoundError:
+            # dmidecode is not installed: skip both dmidecode probes from now on
+            _dmidecode_unavailable = True
+        except Exception:
+            pass
+    if not _dmidecode_unavailable:
+        # Method 2: Try sudo -n dmidecode (works if NOPASSWD is configured)
+        try:
+            raw = subprocess.check_output(
+                ['sudo', '-n', 'dmidecode', '-t', 'memory'], stderr=subprocess.DEVNULL, timeout=3
+            )
+            speeds = _parse_dmidecode_speeds(raw)
+            if speeds:
+                return max(speeds)
+        except Exception:
+            pass
+    if not _decode_dimms_unavailable:
+        # Method 3: Try decode-dimms from i2c-tools
+        try:
+            output = subprocess.check_output(
+                ['decode-dimms'], stderr=subprocess.DEVNULL, timeout=5
+            ).decode('utf-8', errors='replace')
+            for line in output.splitlines():
+                if 'Maximum module speed' in line:
+                    parts = line.split()
+                    for p in parts:
+                        if p.isdigit() and int(p) > 100:
+                            return int(p)
+        except FileNotFoundError:
+            _decode_dimms_unavailable = True
+        except Exception:
+            pass
+    # Method 4: Fallback - return 0 (not available without root)
+    return 0
 
 
 # ---------------------------------------------------------------------------
-# Per-CPU Frequency (Clock Speed)
+# Per-CPU Percentage (Load %)
 # ---------------------------------------------------------------------------
-class Cpu0Frequency(CustomDataSource):
-    last_val = [math.nan] * 10
-    value = 0.0
-    max_freq = 0.0  # Cached max frequency in MHz
-    _max_freq_loaded = False
+# The two sockets share identical logic: generate one class per CPU index from
+# a factory so there is a single code path to maintain and optimize
+def _make_cpu_percentage(index):
+    class _CpuPercentage(CustomDataSource):
+        __slots__ = ()
 
-    def as_numeric(self) -> float:
-        if not Cpu0Frequency._max_freq_loaded:
-            Cpu0Frequency._max_freq_loaded = True
-            if _is_linux:
-                max_freqs = _linux_get_per_cpu_max_frequencies()
-                if 0 in max_freqs:
-                    Cpu0Frequency.max_freq = max_freqs[0]
-        if _is_linux:
-            freqs = _linux_get_per_cpu_frequencies()
-            if 0 in freqs:
-                Cpu0Frequency.value = freqs[0]
-                Cpu0Frequency.last_val.append(Cpu0Frequency.value)
-                Cpu0Frequency.last_val.pop(0)
-                return Cpu0Frequency.value
-        elif _is_windows:
-            _init_lhm()
-            cpu = _get_cpu_by_index_lhm(0)
-            if cpu:
-                frequencies = []
-                for sensor in cpu.Sensors:
-                    if (sensor.SensorType == _lhm_Hardware.SensorType.Clock
-                            and "Core #" in str(sensor.Name)
-                            and "Effective" not in str(sensor.Name)
-                            and sensor.Value is not None):
-                        frequencies.append(float(sensor.Value))
-                if frequencies:
-                    Cpu0Frequency.value = mean(frequencies)
-                    Cpu0Frequency.last_val.append(Cpu0Frequency.value)
-                    Cpu0Frequency.last_val.pop(0)
-                    return Cpu0Frequency.value
-        return math.nan
-
-    def as_string(self) -> str:
-        current_ghz = Cpu0Frequency.value / 1000
-        if Cpu0Frequency.max_freq > 0:
-            max_ghz = Cpu0Frequency.max_freq / 1000
-            return f'{current_ghz:.2f}/{max_ghz:.2f} GHz'
-        return f'{current_ghz:>4.2f} GHz'
+        last_val = deque([math.nan] * 10, maxlen=10)
+        value = 0.0
 
-    def last_values(self) -> List[float]:
-        return Cpu0Frequency.last_val
+        def as_numeric(self) -> float:
+            if _is_linux:
+                usage = _linux_get_per_cpu_usage()
+                if index in usage:
+                    _CpuPercentage.value = usage[index]
+                    _CpuPercentage.last_val.append(_CpuPercentage.value)
+                    return _CpuPercentage.value
+            elif _is_windows:
+                _init_lhm()
+                cpu = _get_cpu_by_index_lhm(index)
+                if cpu:
+                    sensor = _resolve_sensor_lhm(cpu, _LHM_LOAD, ("CPU Total",))
+                    if sensor is not None and sensor.Value is not None:
+                        _CpuPercentage.value = float(sensor.Value)
+                        _CpuPercentage.last_val.append(_CpuPercentage.value)
+                        return _CpuPercentage.value
+            return math.nan
+
+        _cached_str = ""
+        _cached_key = None
+
+        def as_string(self) -> str:
+            # Rebuild the formatted string only when the displayed value changes
+            key = round(_CpuPercentage.value)
+            if key != _CpuPercentage._cached_key:
+                _CpuPercentage._cached_key = key
+                _CpuPercentage._cached_str = f'{_CpuPercentage.value:.0f}%'
+            return _CpuPercentage._cached_str
+
+        def last_values(self) -> Sequence[float]:
+            return _CpuPercentage.last_val
+
+    return _CpuPercentage
+
+
+Cpu0Percentage = _make_cpu_percentage(0)
+Cpu1Percentage = _make_cpu_percentage(1)
 
+# ---------------------------------------------------------------------------
+# Per-CPU Temperature
+# ---------------------------------------------------------------------------
+def _make_cpu_temperature(index):
+    class _CpuTemperature(CustomDataSource):
+        __slots__ = ()
 
-class Cpu1Frequency(CustomDataSource):
-    last_val = [math.nan] * 10
-    value = 0.0
-    max_freq = 0.0  # Cached max frequency in MHz
-    _max_freq_loaded = False
+        last_val = deque([math.nan] * 10, maxlen=10)
+        value = 0.0
 
-    def as_numeric(self) -> float:
-        if not Cpu1Frequency._max_freq_loaded:
-            Cpu1Frequency._max_freq_loaded = True
+        def as_numeric(self) -> float:
             if _is_linux:
-                max_freqs = _linux_get_per_cpu_max_frequencies()
-                if 1 in max_freqs:
-                    Cpu1Frequency.max_freq = max_freqs[1]
-        if _is_linux:
-            freqs = _linux_get_per_cpu_frequencies()
-            if 1 in freqs:
-                Cpu1Frequency.value = freqs[1]
-                Cpu1Frequency.last_val.append(Cpu1Frequency.value)
-                Cpu1Frequency.last_val.pop(0)
-                return Cpu1Frequency.value
-        elif _is_windows:
-            _init_lhm()
-            cpu = _get_cpu_by_index_lhm(1)
-            if cpu:
-                frequencies = []
-                for sensor in cpu.Sensors:
-                    if (sensor.SensorType == _lhm_Hardware.SensorType.Clock
-                            and "Core #" in str(sensor.Name)
-                            and "Effective" not in str(sensor.Name)
-                            and sensor.Value is not None):
-                        frequencies.append(float(sensor.Value))
-                if frequencies:
-                    Cpu1Frequency.value = mean(frequencies)
-                    Cpu1Frequency.last_val.append(Cpu1Frequency.value)
-                    Cpu1Frequency.last_val.pop(0)
-                    return Cpu1Frequency.value
-        return math.nan
-
-    def as_string(self) -> str:
-        current_ghz = Cpu1Frequency.value / 1000
-        if Cpu1Frequency.max_freq > 0:
-            max_ghz = Cpu1Frequency.max_freq / 1000
-            return f'{current_ghz:.2f}/{max_ghz:.2f} GHz'
-        return f'{current_ghz:>4.2f} GHz'
-
-    def last_values(self) -> List[float]:
-        return Cpu1Frequency.last_val
+                temps = _linux_get_cpu_temperatures()
+                if index in temps:
+                    _CpuTemperature.value = temps[index]
+                    _CpuTemperature.last_val.append(_CpuTemperature.value)
+                    return _CpuTemperature.value
+            elif _is_windows:
+                _init_lhm()
+                cpu = _get_cpu_by_index_lhm(index)
+                if cpu:
+                    sensor = _resolve_sensor_lhm(cpu, _LHM_TEMP, _CPU_TEMP_PREFIXES)
+                    if sensor is not None and sensor.Value is not None:
+                        _CpuTemperature.value = float(sensor.Value)
+                        _CpuTemperature.last_val.append(_CpuTemperature.value)
+                        return _CpuTemperature.value
+            return math.nan
+
+        _cached_str = ""
+        _cached_key = None
+
+        def as_string(self) -> str:
+            # Rebuild the formatted string only when the displayed value changes
+            key = round(_CpuTemperature.value)
+            if key != _CpuTemperature._cached_key:
+                _CpuTemperature._cached_key = key
+                _CpuTemperature._cached_str = f'{_CpuTemperature.value:.0f}\u00b0C'
+            return _CpuTemperature._cached_str
+
+        def last_values(self) -> Sequence[float]:
+            return _CpuTemperature.last_val
+
+    return _CpuTemperature
+
+
+Cpu0Temperature = _make_cpu_temperature(0)
+Cpu1Temperature = _make_cpu_temperature(1)
 
+# ---------------------------------------------------------------------------
+# Per-CPU Frequency (Clock Speed)
+# ---------------------------------------------------------------------------
+# Above this sensor count the frequency reduction switches to a preallocated
+# NumPy buffer: on many-core systems the SIMD mean beats the interpreter loop
+_NUMPY_CLOCKS_THRESHOLD = 32
+
+
+def _make_cpu_frequency(index):
+    class _CpuFrequency(CustomDataSource):
+        __slots__ = ()
+
+        last_val = deque([math.nan] * 10, maxlen=10)
+        value = 0.0
+        max_freq = 0.0  # Cached max frequency in MHz
+        _max_freq_loaded = False
+        _np_buf = None  # Preallocated reduction buffer for many-core systems
+
+        def as_numeric(self) -> float:
+            if not _CpuFrequency._max_freq_loaded:
+                _CpuFrequency._max_freq_loaded = True
+                if _is_linux:
+                    max_freqs = _linux_get_per_cpu_max_frequencies()
+                    if index in max_freqs:
+                        _CpuFrequency.max_freq = max_freqs[index]
+            if _is_linux:
+                freqs = _linux_get_per_cpu_frequencies()
+                if index in freqs:
+                    _CpuFrequency.value = freqs[index]
+                    _CpuFrequency.last_val.append(_CpuFrequency.value)
+                    return _CpuFrequency.value
+            elif _is_windows:
+                _init_lhm()
+                cpu = _get_cpu_by_index_lhm(index)
+                if cpu:
+                    clocks = _resolve_core_clocks_lhm(cpu)
+                    if len(clocks) >= _NUMPY_CLOCKS_THRESHOLD:
+                        # Many-core path: fill the preallocated float32 buffer
+                        # and let NumPy do the vectorized mean
+                        buf = _CpuFrequency._np_buf
+                        if buf is None or len(buf) != len(clocks):
+                            buf = _CpuFrequency._np_buf = np.empty(len(clocks), dtype=np.float32)
+                        count = 0
+                        for sensor in clocks:
+                            value = sensor.Value
+                            if value is not None:
+                                buf[count] = value
+                                count += 1
+                        if count:
+                            _CpuFrequency.value = float(buf[:count].mean())
+                            _CpuFrequency.last_val.append(_CpuFrequency.value)
+                            return _CpuFrequency.value
+                    else:
+                        # Tight reduction over the cached clock sensors:
+                        # statistics.mean is far heavier than a plain sum/count
+                        total = 0.0
+                        count = 0
+                        for sensor in clocks:
+                            value = sensor.Value
+                            if value is not None:
+                                total += float(value)
+                                count += 1
+                        if count:
+                            _CpuFrequency.value = total / count
+                            _CpuFrequency.last_val.append(_CpuFrequency.value)
+                            return _CpuFrequency.value
+            return math.nan
+
+        _cached_str = ""
+        _cached_key = None
+        _max_suffix = None  # '/X.XX GHz' tail, formatted once: max_freq never changes
+
+        def as_string(self) -> str:
+            # 10 MHz granularity matches the 2-decimal GHz display precision
+            key = (round(_CpuFrequency.value / 10), _CpuFrequency.max_freq)
+            if key != _CpuFrequency._cached_key:
+                _CpuFrequency._cached_key = key
+                current_ghz = _CpuFrequency.value / 1000
+                if _CpuFrequency.max_freq > 0:
+                    if _CpuFrequency._max_suffix is None:
+                        _CpuFrequency._max_suffix = f'/{_CpuFrequency.max_freq / 1000:.2f} GHz'
+                    _CpuFrequency._cached_str = f'{current_ghz:.2f}{_CpuFrequency._max_suffix}'
+                else:
+                    _CpuFrequency._cached_str = f'{current_ghz:>4.2f} GHz'
+            return _CpuFrequency._cached_str
+
+        def last_values(self) -> Sequence[float]:
+            return _CpuFrequency.last_val
+
+    return _CpuFrequency
+
+
+Cpu0Frequency = _make_cpu_frequency(0)
+Cpu1Frequency = _make_cpu_frequency(1)
 
 # ---------------------------------------------------------------------------
 # RAM Clock Speed
 # Linux: reads via dmidecode (needs root) or returns 0
 # Windows: reads from LHM Memory hardware
 # ---------------------------------------------------------------------------
+# Resolved Memory hardware object, cached so the full _lhm_handle.Hardware
+# collection is only scanned once
+_lhm_memory_cache = None
+
+
+def _get_memory_clock_sensor_lhm():
+    """Resolve (and cache) the Memory hardware and its clock sensor from LHM."""
+    global _lhm_memory_cache
+    _init_lhm()
+    if _lhm_handle is None:
+        return None
+    if _lhm_memory_cache is None:
+        for hardware in _lhm_handle.Hardware:
+            if int(hardware.HardwareType) == _LHM_HW_MEMORY:
+                _lhm_memory_cache = hardware
+                break
+        if _lhm_memory_cache is None:
+            return None
+    tick_lhm()
+    key = (id(_lhm_memory_cache), 'mem_clock')
+    sensor = _lhm_sensor_cache.get(key)
+    if sensor is None:
+        for (sensor_type_key, _name), sensors in _get_sensor_index_lhm(_lhm_memory_cache).items():
+            if sensor_type_key == _LHM_CLOCK and sensors[0].Value is not None:
+                sensor = sensors[0]
+                break
+        _lhm_sensor_cache[key] = sensor if sensor is not None else _MISSING
+    return None if sensor is _MISSING else sensor
+
+
+# The first probe can block for several seconds of subprocess timeouts: run it
+# on a background thread so the UI thread never waits on it
+_memory_clock_probe_started = False
+_memory_clock_probe_lock = threading.Lock()
+
+
+def _prime_memory_clock():
+    global _memory_clock_probe_started
+    speed = _linux_get_memory_clock()
+    if speed > 0:
+        MemoryClockSpeed.value = float(speed)
+        MemoryClockSpeed._cache_expiry = math.inf
+    else:
+        MemoryClockSpeed._cache_expiry = time.monotonic() + MemoryClockSpeed._RETRY_FAILED_LINUX
+        # Allow a fresh probe once the retry deadline has passed
+        _memory_clock_probe_started = False
+
+
+def _start_memory_clock_probe():
+    """Lazily kick off the blocking probe on first sensor read."""
+    global _memory_clock_probe_started
+    if _memory_clock_probe_started:
+        return
+    with _memory_clock_probe_lock:
+        if not _memory_clock_probe_started:
+            threading.Thread(target=_prime_memory_clock, name="memory-clock-probe", daemon=True).start()
+            _memory_clock_probe_started = True
+
+
 class MemoryClockSpeed(CustomDataSource):
+    __slots__ = ()
+
     value = 0.0
-    _cached = False
+    _cache_expiry = 0.0  # monotonic deadline until which the cached result holds
+    # A failed probe is cached too: the blocking dmidecode path is only retried
+    # hourly on Linux, the cheap LHM read every 2 seconds on Windows
+    _RETRY_FAILED_LINUX = 3600.0
+    _RETRY_FAILED_WINDOWS = 2.0
 
     def as_numeric(self) -> float:
-        # Memory clock rarely changes, cache after first read
-        if MemoryClockSpeed._cached and MemoryClockSpeed.value > 0:
-            return MemoryClockSpeed.value
+        # Memory clock rarely changes: a success is cached forever and a
+        # failure until its retry deadline, so a non-root box does not fork
+        # dmidecode on every frame
+        now = time.monotonic()
+        if now < MemoryClockSpeed._cache_expiry:
+            return MemoryClockSpeed.value if MemoryClockSpeed.value > 0 else math.nan
 
         if _is_linux:
-            speed = _linux_get_memory_clock()
-            if speed > 0:
-                MemoryClockSpeed.value = float(speed)
-                MemoryClockSpeed._cached = True
-                return MemoryClockSpeed.value
+            # The probe runs off-thread; NaN is reported until a result lands
+            _start_memory_clock_probe()
+            return MemoryClockSpeed.value if MemoryClockSpeed.value > 0 else math.nan
         elif _is_windows:
-            _init_lhm()
-            if _lhm_handle is not None:
-                try:
-                    for hardware in _lhm_handle.Hardware:
-                        if hardware.HardwareType == _lhm_Hardware.HardwareType.Memory:
-                            hardware.Update()
-                            for sensor in hardware.Sensors:
-                                if (sensor.SensorType == _lhm_Hardware.SensorType.Clock
-                                        and sensor.Value is not None):
-                                    MemoryClockSpeed.value = float(sensor.Value)
-                                    MemoryClockSpeed._cached = True
-                                    return MemoryClockSpeed.value
-                except Exception:
-                    pass
+            try:
+                sensor = _get_memory_clock_sensor_lhm()
+                if sensor is not None and sensor.Value is not None:
+                    MemoryClockSpeed.value = float(sensor.Value)
+                    MemoryClockSpeed._cache_expiry = math.inf
+                    return MemoryClockSpeed.value
+            except (AttributeError, SystemError):
+                # Only swallow pythonnet interop failures: anything else is a
+                # real bug that should surface instead of silently reading NaN
+                pass
+            MemoryClockSpeed._cache_expiry = now + MemoryClockSpeed._RETRY_FAILED_WINDOWS
         return math.nan
 
+    _cached_str = 'N/A'
+    _cached_val = 0.0
+
     def as_string(self) -> str:
+        # The clock never changes once probed, so the string is formatted once
         if MemoryClockSpeed.value > 0:
-            return f'{MemoryClockSpeed.value:>4.0f} MHz'
+            if MemoryClockSpeed.value != MemoryClockSpeed._cached_val:
+                MemoryClockSpeed._cached_val = MemoryClockSpeed.value
+                MemoryClockSpeed._cached_str = f'{MemoryClockSpeed.value:>4.0f} MHz'
+            return MemoryClockSpeed._cached_str
         return 'N/A'
 
-    def last_values(self) -> List[float]:
+    def last_values(self) -> Sequence[float]:
         return None
 
 
 # ---------------------------------------------------------------------------
 # Disk Read/Write Speed (via psutil delta calculation - cross platform)
 # ---------------------------------------------------------------------------
+# A single background thread samples the disk counters once per second so the
+# UI thread never blocks on psutil, and read/write speeds are always derived
+# from the same pair of kernel snapshots
+_disk_samples = deque(maxlen=2)
+_disk_sampler_started = False
+_disk_sampler_lock = threading.Lock()
+_DISK_SAMPLE_PERIOD = 1.0  # seconds
+
+
+def _disk_sampler_loop():
+    while True:
+        try:
+            _disk_samples.append((time.monotonic_ns(), psutil.disk_io_counters(nowrap=False)))
+        except Exception:
+            pass
+        time.sleep(_DISK_SAMPLE_PERIOD)
+
+
+def _start_disk_sampler():
+    """Lazily start the disk sampling thread on first sensor read."""
+    global _disk_sampler_started
+    if _disk_sampler_started:
+        return
+    with _disk_sampler_lock:
+        if not _disk_sampler_started:
+            threading.Thread(target=_disk_sampler_loop, name="disk-io-sampler", daemon=True).start()
+            _disk_sampler_started = True
+
+
+def _disk_delta_mb_s(field):
+    """Compute MB/s for a counter field from the sampler's two snapshots."""
+    samples = tuple(_disk_samples)
+    if len(samples) == 2:
+        (t0_ns, c0), (t1_ns, c1) = samples
+        dt_ns = t1_ns - t0_ns
+        if dt_ns > 0:
+            return (getattr(c1, field) - getattr(c0, field)) * 1_000_000_000 / dt_ns / (1024 * 1024)
+    return None
+
+
 class DiskReadSpeed(CustomDataSource):
-    last_val = [math.nan] * 10
+    __slots__ = ()
+
+    last_val = deque([math.nan] * 10, maxlen=10)
     value = 0.0
-    _prev_bytes = None
-    _prev_time = None
+    _min_interval_ns = 1_000_000_000  # History advances at most once per second
+    _last_sample_time_ns = 0
 
     def as_numeric(self) -> float:
-        counters = psutil.disk_io_counters()
-        now = time.time()
-        if DiskReadSpeed._prev_bytes is not None and DiskReadSpeed._prev_time is not None:
-            dt = now - DiskReadSpeed._prev_time
-            if dt > 0:
-                DiskReadSpeed.value = (counters.read_bytes - DiskReadSpeed._prev_bytes) / dt / (1024 * 1024)
-        DiskReadSpeed._prev_bytes = counters.read_bytes
-        DiskReadSpeed._prev_time = now
+        _start_disk_sampler()
+        # Consume the sampler output at the metric's natural cadence even if
+        # the UI polls faster
+        now_ns = time.monotonic_ns()
+        if now_ns - DiskReadSpeed._last_sample_time_ns < DiskReadSpeed._min_interval_ns:
+            return DiskReadSpeed.value
+        DiskReadSpeed._last_sample_time_ns = now_ns
+        speed = _disk_delta_mb_s('read_bytes')
+        if speed is not None:
+            DiskReadSpeed.value = speed
 
         DiskReadSpeed.last_val.append(DiskReadSpeed.value)
-        DiskReadSpeed.last_val.pop(0)
         return DiskReadSpeed.value
 
-    def as_string(self) -> str:
-        if DiskReadSpeed.value >= 1000:
-            return f'{DiskReadSpeed.value / 1024:>5.1f} GB/s'
-        return f'{DiskReadSpeed.value:>5.1f} MB/s'
+    _cached_str = ""
+    _cached_key = None
 
-    def last_values(self) -> List[float]:
+    def as_string(self) -> str:
+        # 0.1 MB/s granularity matches the 1-decimal display precision
+        key = round(DiskReadSpeed.value * 10)
+        if key != DiskReadSpeed._cached_key:
+            DiskReadSpeed._cached_key = key
+            if DiskReadSpeed.value >= 1000:
+                DiskReadSpeed._cached_str = f'{DiskReadSpeed.value / 1024:>5.1f} GB/s'
+            else:
+                DiskReadSpeed._cached_str = f'{DiskReadSpeed.value:>5.1f} MB/s'
+        return DiskReadSpeed._cached_str
+
+    def last_values(self) -> Sequence[float]:
         return DiskReadSpeed.last_val
 
 
 class DiskWriteSpeed(CustomDataSource):
-    last_val = [math.nan] * 10
+    __slots__ = ()
+
+    last_val = deque([math.nan] * 10, maxlen=10)
     value = 0.0
-    _prev_bytes = None
-    _prev_time = None
+    _min_interval_ns = 1_000_000_000  # History advances at most once per second
+    _last_sample_time_ns = 0
 
     def as_numeric(self) -> float:
-        counters = psutil.disk_io_counters()
-        now = time.time()
-        if DiskWriteSpeed._prev_bytes is not None and DiskWriteSpeed._prev_time is not None:
-            dt = now - DiskWriteSpeed._prev_time
-            if dt > 0:
-                DiskWriteSpeed.value = (counters.write_bytes - DiskWriteSpeed._prev_bytes) / dt / (1024 * 1024)
-        DiskWriteSpeed._prev_bytes = counters.write_bytes
-        DiskWriteSpeed._prev_time = now
+        _start_disk_sampler()
+        # Consume the sampler output at the metric's natural cadence even if
+        # the UI polls faster
+        now_ns = time.monotonic_ns()
+        if now_ns - DiskWriteSpeed._last_sample_time_ns < DiskWriteSpeed._min_interval_ns:
+            return DiskWriteSpeed.value
+        DiskWriteSpeed._last_sample_time_ns = now_ns
+        speed = _disk_delta_mb_s('write_bytes')
+        if speed is not None:
+            DiskWriteSpeed.value = speed
 
         DiskWriteSpeed.last_val.append(DiskWriteSpeed.value)
-        DiskWriteSpeed.last_val.pop(0)
         return DiskWriteSpeed.value
 
-    def as_string(self) -> str:
-        if DiskWriteSpeed.value >= 1000:
-            return f'{DiskWriteSpeed.value / 1024:>5.1f} GB/s'
-        return f'{DiskWriteSpeed.value:>5.1f} MB/s'
+    _cached_str = ""
+    _cached_key = None
 
-    def last_values(self) -> List[float]:
+    def as_string(self) -> str:
+        # 0.1 MB/s granularity matches the 1-decimal display precision
+        key = round(DiskWriteSpeed.value * 10)
+        if key != DiskWriteSpeed._cached_key:
+            DiskWriteSpeed._cached_key = key
+            if DiskWriteSpeed.value >= 1000:
+                DiskWriteSpeed._cached_str = f'{DiskWriteSpeed.value / 1024:>5.1f} GB/s'
+            else:
+                DiskWriteSpeed._cached_str = f'{DiskWriteSpeed.value:>5.1f} MB/s'
+        return DiskWriteSpeed._cached_str
+
+    def last_values(self) -> Sequence[float]:
         return DiskWriteSpeed.last_val
 
 
 # ---------------------------------------------------------------------------
 # CPU Fan Speeds (via psutil sensors_fans - nct6779 chip on X99 dual-CPU)
 # ---------------------------------------------------------------------------
+@_snapshot_cached
 def _linux_get_fan_speeds() -> dict:
     """Get fan speeds from nct6779 chip via psutil."""
     try:
@@ -721,11 +1037,10 @@ def _linux_get_fan_speeds() -> dict:
 
 def _linux_find_nct_hwmon_path() -> str:
     """Find the sysfs hwmon path for the nct6779 chip."""
-    import glob
     for d in glob.glob('/sys/class/hwmon/hwmon*/'):
         try:
             with open(d + 'name') as f:
-                if 'nct' in f.read().strip().lower():
+                if _FAN_CHIP_MARKER in f.read().strip().lower():
                     return d.rstrip('/')
         except Exception:
             continue
@@ -734,6 +1049,33 @@ def _linux_find_nct_hwmon_path() -> str:
 # Cache the hwmon path so we only search once
 _nct_hwmon_path = None
 
+# File descriptors for sysfs files polled every tick stay open across reads:
+# os.pread re-reads from offset 0 without redoing the path lookup each frame.
+# One-shot reads (topology, max freq) keep the plain open/close helper instead
+# so they do not pin descriptors for the process lifetime.
+_sysfs_fds = {}
+
+
+def _close_sysfs_fds():
+    while _sysfs_fds:
+        _path, fd = _sysfs_fds.popitem()
+        try:
+            os.close(fd)
+        except OSError:
+            pass
+
+
+atexit.register(_close_sysfs_fds)
+
+
+def _read_sysfs_cached_fd(path):
+    """Read a small sysfs file through a descriptor kept open across polls."""
+    fd = _sysfs_fds.get(path)
+    if fd is None:
+        fd = os.open(path, os.O_RDONLY)
+        _sysfs_fds[path] = fd
+    return os.pread(fd, 32, 0)
+
 
 def _linux_get_fan_pwm_percent(fan_index: int) -> float:
     """Get fan PWM duty cycle as a percentage (0-100) by fan index (0-based)."""
@@ -743,99 +1085,107 @@ def _linux_get_fan_pwm_percent(fan_index: int) -> float:
     if not _nct_hwmon_path:
         return -1.0
     try:
-        pwm_file = f'{_nct_hwmon_path}/pwm{fan_index + 1}'
-        with open(pwm_file) as f:
-            pwm_val = int(f.read().strip())
+        pwm_val = int(_read_sysfs_cached_fd(f'{_nct_hwmon_path}/pwm{fan_index + 1}'))
         return round(pwm_val / 255.0 * 100.0)
     except Exception:
         return -1.0
 
 
-class Cpu0FanSpeed(CustomDataSource):
-    """Fan speed for CPU 0 (first fan from nct6779)."""
-    last_val = [math.nan] * 10
-    value = 0.0
-    pwm_pct = -1.0
+# The fan chip key inside psutil.sensors_fans() is constant: resolve it once so
+# the per-poll path does a plain dict lookup instead of substring matching
+_FAN_CHIP_MARKER = 'nct'
+_fan_chip_name = None
 
-    @staticmethod
-    def _get_fan_rpm(fan_index: int) -> float:
-        """Get fan RPM by index from nct6779 chip."""
-        try:
-            fans = psutil.sensors_fans()
-            for chip_name, entries in fans.items():
-                if 'nct' in chip_name.lower():
-                    if fan_index < len(entries):
-                        return float(entries[fan_index].current)
-        except Exception:
-            pass
-        return 0.0
 
-    def as_numeric(self) -> float:
-        Cpu0FanSpeed.value = Cpu0FanSpeed._get_fan_rpm(0)
-        if _is_linux:
-            Cpu0FanSpeed.pwm_pct = _linux_get_fan_pwm_percent(0)
-        Cpu0FanSpeed.last_val.append(Cpu0FanSpeed.value)
-        Cpu0FanSpeed.last_val.pop(0)
-        return Cpu0FanSpeed.value
-
-    def as_string(self) -> str:
-        if Cpu0FanSpeed.pwm_pct >= 0:
-            return f'{Cpu0FanSpeed.value:.0f}RPM ({Cpu0FanSpeed.pwm_pct:.0f}%)'
-        return f'{Cpu0FanSpeed.value:.0f} RPM'
-
-    def last_values(self) -> List[float]:
-        return Cpu0FanSpeed.last_val
+def _get_fan_rpm(fan_index: int) -> float:
+    """Get fan RPM by index from nct6779 chip."""
+    global _fan_chip_name
+    try:
+        fans = psutil.sensors_fans()
+        if _fan_chip_name is None:
+            for chip_name in fans:
+                if _FAN_CHIP_MARKER in chip_name.lower():
+                    _fan_chip_name = chip_name
+                    break
+            else:
+                return 0.0
+        entries = fans.get(_fan_chip_name, ())
+        if fan_index < len(entries):
+            return float(entries[fan_index].current)
+    except (AttributeError, OSError):
+        # sensors_fans() is missing on some platforms (AttributeError) or can
+        # fail reading hwmon (OSError); other errors should surface
+        pass
+    return 0.0
+
+
+def _make_cpu_fan_speed(index):
+    class _CpuFanSpeed(CustomDataSource):
+        """Fan speed for a CPU by index (fans from nct6779)."""
+        __slots__ = ()
+
+        last_val = deque([math.nan] * 10, maxlen=10)
+        value = 0.0
+        pwm_pct = -1.0
+        _min_interval = 1.0  # Fan speed is sampled at most once per second
+        _last_sample_time = 0.0
+
+        def as_numeric(self) -> float:
+            # Sample at the metric's natural cadence even if the UI polls faster
+            now = time.monotonic()
+            if now - _CpuFanSpeed._last_sample_time < _CpuFanSpeed._min_interval:
+                return _CpuFanSpeed.value
+            _CpuFanSpeed._last_sample_time = now
+            _CpuFanSpeed.value = _get_fan_rpm(index)
+            if _is_linux:
+                _CpuFanSpeed.pwm_pct = _linux_get_fan_pwm_percent(index)
+            _CpuFanSpeed.last_val.append(_CpuFanSpeed.value)
+            return _CpuFanSpeed.value
 
+        def as_string(self) -> str:
+            if _CpuFanSpeed.pwm_pct >= 0:
+                return f'{_CpuFanSpeed.value:.0f}RPM ({_CpuFanSpeed.pwm_pct:.0f}%)'
+            return f'{_CpuFanSpeed.value:.0f} RPM'
 
-class Cpu1FanSpeed(CustomDataSource):
-    """Fan speed for CPU 1 (second fan from nct6779)."""
-    last_val = [math.nan] * 10
-    value = 0.0
-    pwm_pct = -1.0
+        def last_values(self) -> Sequence[float]:
+            return _CpuFanSpeed.last_val
 
-    def as_numeric(self) -> float:
-        Cpu1FanSpeed.value = Cpu0FanSpeed._get_fan_rpm(1)
-        if _is_linux:
-            Cpu1FanSpeed.pwm_pct = _linux_get_fan_pwm_percent(1)
-        Cpu1FanSpeed.last_val.append(Cpu1FanSpeed.value)
-        Cpu1FanSpeed.last_val.pop(0)
-        return Cpu1FanSpeed.value
+    return _CpuFanSpeed
 
-    def as_string(self) -> str:
-        if Cpu1FanSpeed.pwm_pct >= 0:
-            return f'{Cpu1FanSpeed.value:.0f}RPM ({Cpu1FanSpeed.pwm_pct:.0f}%)'
-        return f'{Cpu1FanSpeed.value:.0f} RPM'
 
-    def last_values(self) -> List[float]:
-        return Cpu1FanSpeed.last_val
+Cpu0FanSpeed = _make_cpu_fan_speed(0)
+Cpu1FanSpeed = _make_cpu_fan_speed(1)
 
 # ---------------------------------------------------------------------------
 # NVMe Temperature (via psutil sensors_temperatures - Composite reading)
 # ---------------------------------------------------------------------------
 class NvmeTemperature(CustomDataSource):
     """NVMe drive Composite temperature."""
-    last_val = [math.nan] * 10
+    __slots__ = ()
+
+    last_val = deque([math.nan] * 10, maxlen=10)
     value = 0.0
+    _composite_idx = None  # Position of the Composite entry, found once
 
     def as_numeric(self) -> float:
-        if platform.system() == "Linux":
-            try:
-                temps = psutil.sensors_temperatures()
-                if 'nvme' in temps:
-                    for t in temps['nvme']:
+        if _is_linux:
+            entries = _get_sensor_temps().get('nvme')
+            if entries:
+                idx = NvmeTemperature._composite_idx
+                if idx is None:
+                    for i, t in enumerate(entries):
                         if t.label == 'Composite':
-                            NvmeTemperature.value = t.current
+                            NvmeTemperature._composite_idx = idx = i
                             break
-            except Exception:
-                pass
+                if idx is not None and idx < len(entries):
+                    NvmeTemperature.value = entries[idx].current
         NvmeTemperature.last_val.append(NvmeTemperature.value)
-        NvmeTemperature.last_val.pop(0)
         return NvmeTemperature.value
 
     def as_string(self) -> str:
         return f'{NvmeTemperature.value:.0f}\u00b0C'
 
-    def last_values(self) -> List[float]:
+    def last_values(self) -> Sequence[float]:
         return NvmeTemperature.last_val
 
 
@@ -844,30 +1194,33 @@ class NvmeTemperature(CustomDataSource):
 # ---------------------------------------------------------------------------
 class NvmeNandTemperature(CustomDataSource):
     """NVMe NAND flash memory temperature (Sensor 2)."""
-    last_val = [math.nan] * 10
+    __slots__ = ()
+
+    last_val = deque([math.nan] * 10, maxlen=10)
     value = 0.0
+    _sensor_idx = None  # Position of the NAND entry, found once
 
     def as_numeric(self) -> float:
-        if platform.system() == "Linux":
-            try:
-                temps = psutil.sensors_temperatures()
-                if 'nvme' in temps:
-                    for t in temps['nvme']:
-                        if t.label != 'Composite' and t.label:
-                            NvmeNandTemperature.value = t.current
+        if _is_linux:
+            entries = _get_sensor_temps().get('nvme')
+            if entries:
+                idx = NvmeNandTemperature._sensor_idx
+                if idx is None:
+                    for i, t in enumerate(entries):
+                        if t.label and t.label != 'Composite':
+                            NvmeNandTemperature._sensor_idx = idx = i
                             break
                     else:
                         # Fallback: use index 1 if labels don't match
-                        if len(temps['nvme']) > 1:
-                            NvmeNandTemperature.value = temps['nvme'][1].current
-            except Exception:
-                pass
+                        if len(entries) > 1:
+                            NvmeNandTemperature._sensor_idx = idx = 1
+                if idx is not None and idx < len(entries):
+                    NvmeNandTemperature.value = entries[idx].current
         NvmeNandTemperature.last_val.append(NvmeNandTemperature.value)
-        NvmeNandTemperature.last_val.pop(0)
         return NvmeNandTemperature.value
 
     def as_string(self) -> str:
         return f'{NvmeNandTemperature.value:.0f}\u00b0C'
 
-    def last_values(self) -> List[float]:
+    def last_values(self) -> Sequence[float]:
         return NvmeNandTemperature.last_val
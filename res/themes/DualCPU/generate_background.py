@@ -1,13 +1,18 @@
 #!/usr/bin/env python3
 """Generate the dark gradient background image for the DualCPU theme.
 Run this script once to create background.png in the same directory.
-Requires Pillow: pip install Pillow
+Requires Pillow and NumPy: pip install Pillow numpy
 """
+import os
+
+import numpy as np
 from PIL import Image, ImageDraw
 
 WIDTH = 480
 HEIGHT = 800
 
+OUT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "background.png")
+
 # Color palette
 COLOR_TOP = (16, 18, 40)        # Dark navy top
 COLOR_BOTTOM = (10, 12, 28)     # Slightly darker bottom
@@ -16,6 +21,10 @@ SECTION_BG = (18, 22, 50)       # Slightly lighter section header areas
 PANEL_BG = (20, 24, 52)         # Subtle panel background
 PANEL_BORDER = (0, 60, 100)     # Panel border color (dim cyan)
 DIVIDER_COLOR = (0, 50, 85)     # Very subtle divider below titles
+GLOW = (0, 26, 43)              # Faded second row under accent lines (ACCENT_DIM // 3)
+
+# X extents of the full-width separator lines
+LINE_X0, LINE_X1 = 8, WIDTH - 8
 
 # Section separator Y positions (horizontal full-width lines)
 #   Header 0-50 | CPU 50-294 | RAM 294-372 | DISK 372-534 | NET+PING 534-800
@@ -28,70 +37,118 @@ RAM_PANEL = (8, 298, 472, 368)
 DISK_PANEL = (8, 376, 472, 530)
 NET_PING_PANEL = (8, 538, 472, 796)
 
-
-def lerp_color(c1, c2, t):
-    """Linear interpolation between two RGB colors."""
-    return tuple(int(c1[i] + (c2[i] - c1[i]) * t) for i in range(3))
-
-
-def draw_rounded_rect(draw, box, radius, fill, outline):
-    """Draw a rounded rectangle."""
+# Single-pixel lines drawn inside the panels (x1, y1, x2, y2, color):
+# title dividers, the DISK R/W and NET UP/DL column splits, and the
+# NET/PING horizontal with its glow row
+INTERNAL_LINES = [
+    (22, 82, 220, 82, DIVIDER_COLOR),    # CPU1 title divider
+    (260, 82, 458, 82, DIVIDER_COLOR),   # CPU2 title divider
+    (22, 322, 458, 322, DIVIDER_COLOR),  # RAM title divider
+    (22, 402, 458, 402, DIVIDER_COLOR),  # DISK title divider
+    (22, 562, 458, 562, DIVIDER_COLOR),  # NET title divider
+    (240, 448, 240, 524, ACCENT_DIM),    # DISK vertical (R | W)
+    (240, 568, 240, 660, ACCENT_DIM),    # NET vertical (UP | DL)
+    (22, 668, 458, 668, ACCENT_DIM),     # NET / PING horizontal
+    (22, 669, 458, 669, GLOW),
+]
+
+
+PANEL_RADIUS = 8
+
+
+def _rounded_corner_masks(radius):
+    """Rasterize one rounded corner with Pillow and return its masks.
+
+    All panels share the same radius, so Pillow's rounded_rectangle is run
+    once on a small probe and the top-left (radius+1)² block is extracted as
+    (fill, border) boolean masks. Blitting with these masks reproduces
+    Pillow's corner rasterization exactly without re-rendering per panel."""
+    size = 2 * radius + 4
+    probe = Image.new("L", (size, size), 0)
+    ImageDraw.Draw(probe).rounded_rectangle([0, 0, size - 1, size - 1],
+                                            radius=radius, fill=1, outline=2)
+    corner = np.asarray(probe)[:radius + 1, :radius + 1]
+    return corner == 1, corner == 2
+
+
+def draw_panel(arr, box, fill, border, masks):
+    """Blit one rounded panel into the array: edge/fill slice writes plus
+    masked corner fixes restoring the gradient outside the arcs."""
     x1, y1, x2, y2 = box
-    draw.rounded_rectangle([x1, y1, x2, y2], radius=radius, fill=fill, outline=outline)
+    region = arr[y1:y2 + 1, x1:x2 + 1]
+    background = region.copy()
+    region[:] = fill
+    region[0, :] = border
+    region[-1, :] = border
+    region[:, 0] = border
+    region[:, -1] = border
+
+    fill_mask, border_mask = masks
+    k = fill_mask.shape[0]
+    for ys, xs, flip in (
+        (slice(0, k), slice(0, k), (slice(None), slice(None))),        # top-left
+        (slice(0, k), slice(-k, None), (slice(None), slice(None, None, -1))),   # top-right
+        (slice(-k, None), slice(0, k), (slice(None, None, -1), slice(None))),   # bottom-left
+        (slice(-k, None), slice(-k, None), (slice(None, None, -1), slice(None, None, -1))),  # bottom-right
+    ):
+        f = fill_mask[flip]
+        b = border_mask[flip]
+        block = region[ys, xs]
+        outside = ~(f | b)
+        block[outside] = background[ys, xs][outside]
+        block[b] = border
 
 
 def generate():
-    img = Image.new("RGB", (WIDTH, HEIGHT), COLOR_TOP)
-    draw = ImageDraw.Draw(img)
+    # The output only depends on this script: skip the rebuild when
+    # background.png is already newer than the source
+    if os.path.exists(OUT_PATH) and os.path.getmtime(OUT_PATH) >= os.path.getmtime(__file__):
+        print(f"Background up to date: {OUT_PATH}")
+        return
+
+    # Build the vertical gradient in one vectorized pass: one interpolated
+    # color per row, broadcast across the width, instead of 800 draw.line
+    # calls with per-row Python interpolation
+    t = np.linspace(0, 1, HEIGHT, endpoint=False, dtype=np.float32)[:, None]
+    top = np.array(COLOR_TOP, dtype=np.float32)
+    bottom = np.array(COLOR_BOTTOM, dtype=np.float32)
+    rows = (top + (bottom - top) * t).astype(np.uint8)
+    arr = np.broadcast_to(rows[:, None, :], (HEIGHT, WIDTH, 3)).copy()
+
+    # Subtle header band: lerp the top rows towards SECTION_BG in one slice
+    # assignment, truncating at both stages like the original per-row lerp
+    t_hdr = np.arange(0, 50, dtype=np.float64)[:, None] / HEIGHT
+    base = np.trunc(top + (bottom - top) * t_hdr)
+    sec = np.array(SECTION_BG, dtype=np.float64)
+    highlight = (base + (sec - base) * 0.4).astype(np.uint8)
+    arr[0:50] = highlight[:, None, :]
+
+    # The full-width separators lie outside the panel boxes, so they can be
+    # written straight into the array as row slices before rasterizing
+    accent = np.array(ACCENT_DIM, dtype=np.uint8)
+    glow = np.array(GLOW, dtype=np.uint8)
+    for sy in SEPARATORS:
+        arr[sy, LINE_X0:LINE_X1 + 1] = accent
+        arr[sy + 1, LINE_X0:LINE_X1 + 1] = glow
+
+    # Blit the rounded panel boxes: one corner-mask build, five slice writes
+    masks = _rounded_corner_masks(PANEL_RADIUS)
+    panel_bg = np.array(PANEL_BG, dtype=np.uint8)
+    panel_border = np.array(PANEL_BORDER, dtype=np.uint8)
+    for panel in [CPU1_PANEL, CPU2_PANEL, RAM_PANEL, DISK_PANEL, NET_PING_PANEL]:
+        draw_panel(arr, panel, panel_bg, panel_border, masks)
 
-    # Draw vertical gradient background
-    for y in range(HEIGHT):
-        t = y / HEIGHT
-        color = lerp_color(COLOR_TOP, COLOR_BOTTOM, t)
-        draw.line([(0, y), (WIDTH, y)], fill=color)
+    img = Image.fromarray(arr, "RGB")
+    draw = ImageDraw.Draw(img)
 
-    # Draw subtle header band
-    for y in range(0, 50):
-        t = y / HEIGHT
-        base = lerp_color(COLOR_TOP, COLOR_BOTTOM, t)
-        highlight = lerp_color(base, SECTION_BG, 0.4)
-        draw.line([(0, y), (WIDTH, y)], fill=highlight)
+    # The internal dividers sit on top of the panel fills, so they go through
+    # ImageDraw — but as one prebuilt list in a single pass
+    for x1, y1, x2, y2, color in INTERNAL_LINES:
+        draw.line([(x1, y1), (x2, y2)], fill=color, width=1)
 
-    # Draw panel boxes with rounded corners
-    for panel in [CPU1_PANEL, CPU2_PANEL, RAM_PANEL, DISK_PANEL, NET_PING_PANEL]:
-        draw_rounded_rect(draw, panel, radius=8, fill=PANEL_BG, outline=PANEL_BORDER)
-
-    # Sub-label dividers (inside panels, below titles)
-    for x1, y, x2 in [
-        (22, 82, 220),     # CPU1 title divider
-        (260, 82, 458),    # CPU2 title divider
-        (22, 322, 458),    # RAM title divider
-        (22, 402, 458),    # DISK title divider
-        (22, 562, 458),    # NET title divider
-    ]:
-        draw.line([(x1, y), (x2, y)], fill=DIVIDER_COLOR, width=1)
-
-    # DISK internal vertical divider (between R and W columns)
-    draw.line([(240, 448), (240, 524)], fill=ACCENT_DIM, width=1)
-
-    # NET+PING internal dividers
-    # Vertical between UP and DL columns
-    draw.line([(240, 568), (240, 660)], fill=ACCENT_DIM, width=1)
-    # Horizontal between NET and PING
-    glow = tuple(max(0, c // 3) for c in ACCENT_DIM)
-    draw.line([(22, 668), (458, 668)], fill=ACCENT_DIM, width=1)
-    draw.line([(22, 669), (458, 669)], fill=glow, width=1)
-
-    # Draw horizontal full-width separator lines
-    for sy in SEPARATORS:
-        draw.line([(8, sy), (WIDTH - 8, sy)], fill=ACCENT_DIM, width=1)
-        draw.line([(8, sy + 1), (WIDTH - 8, sy + 1)], fill=glow, width=1)
-
-    # Save
-    import os
-    out_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "background.png")
-    img.save(out_path, "PNG")
-    print(f"Background saved to {out_path}")
+    # Save: one-shot static asset, spend encode CPU for a smaller file on disk
+    img.save(OUT_PATH, "PNG", optimize=True, compress_level=9)
+    print(f"Background saved to {OUT_PATH}")
 
 
 if __name__ == "__main__":